@@ -392,6 +392,22 @@ class ScopeManager : ScopeProvider {
         }
     }
 
+    /**
+     * Adds all [declarations] to the scope manager, see [addDeclaration]. This is mainly useful for
+     * language frontends not written in Java or Kotlin (e.g., the Python frontend), for which each
+     * call into the [ScopeManager] is comparatively expensive.
+     *
+     * @param declarations the declarations to add
+     * @param addToAST specifies, whether the declarations also get added to the [Scope.astNode] of
+     *   the current scope. Defaults to true.
+     */
+    @JvmOverloads
+    fun addDeclarations(declarations: List<Declaration>, addToAST: Boolean = true) {
+        for (declaration in declarations) {
+            addDeclaration(declaration, addToAST)
+        }
+    }
+
     /**
      * This function tries to find the first scope that satisfies the condition specified in
      * [predicate]. It starts searching in the [searchScope], moving up-wards using the
@@ -96,8 +96,7 @@ class AssignExpression : Expression(), AssignmentHolder, HasType.TypeListener {
      */
     val isCompoundAssignment: Boolean
         get() {
-            return arrayOf("*=", "/=", "%=", "+=", "-=", "<<=", ">>=", "&=", "^=", "|=")
-                .contains(operatorCode) && isSingleValue
+            return BinaryOperator.compoundOperators.contains(operatorCode) && isSingleValue
         }
 
     /**
@@ -249,6 +249,7 @@ class BinaryOperator :
     companion object {
         /** Required for compound BinaryOperators. This should not be stored in the graph */
         @Transient
-        val compoundOperators = listOf("*=", "/=", "%=", "+=", "-=", "<<=", ">>=", "&=", "^=", "|=")
+        val compoundOperators =
+            listOf("*=", "/=", "%=", "+=", "-=", "<<=", ">>=", "&=", "^=", "|=", "//=", "**=")
     }
 }
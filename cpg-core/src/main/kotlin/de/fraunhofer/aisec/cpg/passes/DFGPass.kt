@@ -371,7 +371,9 @@ class DFGPass : Pass() {
             ">>=",
             "&=",
             "^=",
-            "|=" -> {
+            "|=",
+            "//=",
+            "**=" -> {
                 node.lhs.let {
                     node.addPrevDFG(it)
                     node.addNextDFG(it)
@@ -35,6 +35,7 @@ import de.fraunhofer.aisec.cpg.frontends.cpp.CXXLanguageFrontend
 import de.fraunhofer.aisec.cpg.graph.*
 import de.fraunhofer.aisec.cpg.graph.declarations.ConstructorDeclaration
 import de.fraunhofer.aisec.cpg.graph.declarations.MethodDeclaration
+import de.fraunhofer.aisec.cpg.graph.scopes.FunctionScope
 import de.fraunhofer.aisec.cpg.graph.scopes.NameScope
 import java.io.File
 import kotlin.test.*
@@ -193,4 +194,29 @@ internal class ScopeManagerTest : BaseTest() {
         val scope = s.lookupScope("A::B")
         assertNotNull(scope)
     }
+
+    @Test
+    fun testAddDeclarations() {
+        val s = ScopeManager()
+        val frontend =
+            CXXLanguageFrontend(
+                CPPLanguage(),
+                TranslationConfiguration.builder().build(),
+                s,
+            )
+        s.resetToGlobal(frontend.newTranslationUnitDeclaration("file.cpp", null))
+
+        val func = frontend.newFunctionDeclaration("func", null)
+        s.enterScope(func)
+
+        val a = frontend.newVariableDeclaration("a")
+        val b = frontend.newVariableDeclaration("b")
+        s.addDeclarations(listOf(a, b))
+
+        val scope = s.currentScope as? FunctionScope
+        assertNotNull(scope)
+        assertEquals(listOf(a, b), scope.valueDeclarations)
+
+        s.leaveScope(func)
+    }
 }
@@ -30,7 +30,12 @@ import os
 
 class PythonASTToCPG(ast.NodeVisitor):
     def __init__(self, fname, frontend, code):
-        self.sourcecode = CodeExtractor(fname)
+        self.sourcecode = CodeExtractor(code)
+        self._src_cache = {}  # id(ast node) -> source code snippet
+        self._type_cache = {}  # type name -> parsed type
+        # receiver names of the functions we are currently in (None for
+        # functions that are not methods)
+        self._receiver_name_stack = []
         self.frontend = frontend  # absolute path
         self.tud = DeclarationBuilderKt.newTranslationUnitDeclaration(
             self.frontend, fname, code)
@@ -38,6 +43,8 @@ class PythonASTToCPG(ast.NodeVisitor):
         self.scopemanager = frontend.getScopeManager()
         self.scopemanager.resetToGlobal(self.tud)
         self.logger = self.frontend.Companion.getLog()
+        # queried once, as debug messages are built for almost every node
+        self._log_debug_enabled = self.logger.isDebugEnabled()
         self.rootNode = ast.parse(code, filename=fname, type_comments=True)
 
     # import methods from other files
@@ -56,21 +63,35 @@ class PythonASTToCPG(ast.NodeVisitor):
     from ._misc import is_statement
     from ._misc import is_variable_declaration
     from ._misc import log_with_loc
+    from ._misc import log_with_loc_lazy
+    from ._misc import parse_type
     from ._misc import wrap_declaration_to_stmt
     from ._misc import is_literal
     from ._statements import handle_argument
     from ._statements import handle_assign
     from ._statements import handle_assign_impl
+    from ._statements import handle_break
+    from ._statements import handle_class_def
+    from ._statements import handle_expr
     from ._statements import handle_for
     from ._statements import handle_function_or_method
+    from ._statements import handle_if
+    from ._statements import handle_import
+    from ._statements import handle_import_from
+    from ._statements import handle_not_implemented_statement
+    from ._statements import handle_pass
+    from ._statements import handle_return
     from ._statements import handle_statement
     from ._statements import handle_statement_impl
+    from ._statements import handle_try
+    from ._statements import handle_while
+    from ._statements import make_assign_declaration
     from ._statements import make_compound_statement
 
     def execute(self):
         if isinstance(self.rootNode, ast.Module):
-            self.log_with_loc("Handling tree root: %s" %
-                              (ast.dump(self.rootNode)))
+            self.log_with_loc_lazy(lambda: "Handling tree root: %s" %
+                                   (ast.dump(self.rootNode)))
             # Module(stmt* body, type_ignore* type_ignores)
             # TODO how to name the namespace?
             # TODO improve readability
@@ -80,9 +101,12 @@ class PythonASTToCPG(ast.NodeVisitor):
             self.tud.addDeclaration(nsd)
             self.scopemanager.enterScope(nsd)
 
+            # look up the bound methods only once for all statements
+            handle_statement = self.handle_statement
+            is_declaration = self.is_declaration
             for stmt in self.rootNode.body:
-                r = self.handle_statement(stmt)
-                if self.is_declaration(r):
+                r = handle_statement(stmt)
+                if is_declaration(r):
                     r = self.wrap_declaration_to_stmt(r)
                 nsd.addStatement(r)
 
@@ -27,30 +27,32 @@ from ._spotless_dummy import *
 
 class CodeExtractor:
     # Simple/ugly class to extract code snippets given a region
-    def __init__(self, fname):
-        with open(fname) as f:
-            self.lines = f.read().splitlines()
+    def __init__(self, code):
+        lines = code.splitlines()
+        # The source is split only once. Snippets are then sliced from the
+        # joined source using the precomputed start offset of each line.
+        self.source = "\n".join(lines)
+        self.line_offsets = []
+        self.line_lengths = []
+        offset = 0
+        for line in lines:
+            self.line_offsets.append(offset)
+            self.line_lengths.append(len(line))
+            offset += len(line) + 1
 
-    def get_snippet(self, lineno, col_offset, end_lineno, end_col_offset):
+    def get_offset(self, lineno, col_offset):
         # 1 vs 0-based indexing
         lineno -= 1
-        # col_offset -= 1
-        end_lineno -= 1
-        # end_col_offset -= 1
+        # never read past the end of the line (the AST column offsets are
+        # UTF-8 byte offsets and thus can be too large for non-ASCII lines)
+        return (self.line_offsets[lineno] +
+                min(col_offset, self.line_lengths[lineno]))
+
+    def get_snippet(self, lineno, col_offset, end_lineno, end_col_offset):
+        start = self.get_offset(lineno, col_offset)
+        end = self.get_offset(end_lineno, end_col_offset)
         if lineno == end_lineno:
-            return self.lines[lineno][col_offset:end_col_offset]
+            return self.source[start:end]
         else:
-            res = []
-            # first line is partially read
-            res.append(" " * col_offset + self.lines[lineno][col_offset:])
-            lineno += 1
-
-            # fill with complete lines
-            while lineno < end_lineno:
-                res.append(self.lines[lineno][:])
-                lineno += 1
-
-            # last line is partially read
-            res.append(self.lines[end_lineno][:end_col_offset])
-
-            return "\n".join(res)
+            # first line is partially read, but keep its indentation
+            return " " * col_offset + self.source[start:end]
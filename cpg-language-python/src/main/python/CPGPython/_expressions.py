@@ -23,21 +23,22 @@
 #                    \______/ \__|       \______/
 #
 from ._misc import NOT_IMPLEMENTED_MSG
+from ._misc import UNKNOWN_TYPE
 from ._spotless_dummy import *
 from de.fraunhofer.aisec.cpg.graph import ExpressionBuilderKt
-from de.fraunhofer.aisec.cpg.graph import NodeBuilderKt
-from de.fraunhofer.aisec.cpg.graph.types import UnknownType
 import ast
 
 
 def handle_expression(self, expr):
-    self.log_with_loc("Start \"handle_expression\" for:\n%s\n" %
-                      (self.get_src_code(expr)))
+    if self._log_debug_enabled:
+        self.log_with_loc("Start \"handle_expression\" for:\n%s\n" %
+                          (self.get_src_code(expr)))
     r = self.handle_expression_impl(expr)
     self.add_loc_info(expr, r)
-    self.log_with_loc("End \"handle_expr\" for:\n%s\nResult is: %s" %
-                      (self.get_src_code(expr),
-                       r))
+    if self._log_debug_enabled:
+        self.log_with_loc(
+            "End \"handle_expr\" for:\n%s\nResult is: %s" %
+            (self.get_src_code(expr), r))
     return r
 
 
@@ -63,11 +64,11 @@ def handle_expression_impl(self, expr):
                 return ExpressionBuilderKt(
                     self.frontend,
                     None,
-                    UnknownType.getUnknownType(),
+                    UNKNOWN_TYPE,
                     self.get_src_code(expr),
                     expr)
             # we got a complex number
-            complextype = NodeBuilderKt.parseType(self.frontend, "complex")
+            complextype = self.parse_type("complex")
 
             # TODO: fix this once the CPG supports complex numbers
             realpart = complex(lhs.getValue())
@@ -100,7 +101,7 @@ def handle_expression_impl(self, expr):
         body = self.handle_expression(expr.body)
         orelse = self.handle_expression(expr.orelse)
         r = ExpressionBuilderKt.newConditionalExpression(
-            self.frontend, test, body, orelse, UnknownType.getUnknownType())
+            self.frontend, test, body, orelse, UNKNOWN_TYPE)
         return r
     elif isinstance(expr, ast.Dict):
         ile = ExpressionBuilderKt.newInitializerListExpression(
@@ -240,8 +241,7 @@ def handle_expression_impl(self, expr):
                 if refname == "str" and len(expr.args) == 1:
                     cast = ExpressionBuilderKt.newCastExpression(
                         self.frontend, self.get_src_code(expr))
-                    cast.setCastType(
-                        NodeBuilderKt.parseType(self.frontend, "str"))
+                    cast.setCastType(self.parse_type("str"))
                     cast.setExpression(
                         self.handle_expression(expr.args[0]))
                     return cast
@@ -274,27 +274,27 @@ def handle_expression_impl(self, expr):
     elif isinstance(expr, ast.Constant):
         resultvalue = expr.value
         if isinstance(expr.value, type(None)):
-            tpe = NodeBuilderKt.parseType(self.frontend, "None")
+            tpe = self.parse_type("None")
         elif isinstance(expr.value, bool):
-            tpe = NodeBuilderKt.parseType(self.frontend, "bool")
+            tpe = self.parse_type("bool")
         elif isinstance(expr.value, int):
-            tpe = NodeBuilderKt.parseType(self.frontend, "int")
+            tpe = self.parse_type("int")
         elif isinstance(expr.value, float):
-            tpe = NodeBuilderKt.parseType(self.frontend, "float")
+            tpe = self.parse_type("float")
         elif isinstance(expr.value, complex):
-            tpe = NodeBuilderKt.parseType(self.frontend, "complex")
+            tpe = self.parse_type("complex")
             # TODO: fix this once the CPG supports complex numbers
             resultvalue = str(resultvalue)
         elif isinstance(expr.value, str):
-            tpe = NodeBuilderKt.parseType(self.frontend, "str")
+            tpe = self.parse_type("str")
         elif isinstance(expr.value, bytes):
-            tpe = NodeBuilderKt.parseType(self.frontend, "byte[]")
+            tpe = self.parse_type("byte[]")
         else:
             self.log_with_loc(
                 "Found unexpected type - using a dummy: %s" %
                 (type(expr.value)),
                 loglevel="ERROR")
-            tpe = UnknownType.getUnknownType()
+            tpe = UNKNOWN_TYPE
         lit = ExpressionBuilderKt.newLiteral(
             self.frontend,
             resultvalue, tpe, self.get_src_code(expr))
@@ -312,7 +312,7 @@ def handle_expression_impl(self, expr):
                 self.frontend,
                 value.getName(), value.getType(), value.getCode())
         mem = ExpressionBuilderKt.newMemberExpression(
-            self.frontend, expr.attr, value, UnknownType.getUnknownType(),
+            self.frontend, expr.attr, value, UNKNOWN_TYPE,
             ".", self.get_src_code(expr))
         return mem
 
@@ -330,7 +330,7 @@ def handle_expression_impl(self, expr):
         return r
     elif isinstance(expr, ast.Name):
         r = ExpressionBuilderKt.newDeclaredReferenceExpression(
-            self.frontend, expr.id, UnknownType.getUnknownType(),
+            self.frontend, expr.id, UNKNOWN_TYPE,
             self.get_src_code(expr))
 
         # Take a little shortcut and set refersTo, in case this is a method
@@ -25,21 +25,53 @@
 from ._spotless_dummy import *
 import inspect
 import ast
+from de.fraunhofer.aisec.cpg.graph import NodeBuilderKt
 from de.fraunhofer.aisec.cpg.graph import StatementBuilderKt
+from de.fraunhofer.aisec.cpg.graph.types import UnknownType
 from de.fraunhofer.aisec.cpg.sarif import PhysicalLocation
 from de.fraunhofer.aisec.cpg.sarif import Region
 from java.io import File
 
 NOT_IMPLEMENTED_MSG = "This has not been implemented, yet. Using a dummy."
 CPG_JAVA = "de.fraunhofer.aisec.cpg"
+# UnknownType is a singleton, so there is no need to fetch it over and over
+UNKNOWN_TYPE = UnknownType.getUnknownType()
 
 
 def get_src_code(self, node: ast.AST):
-    return self.sourcecode.get_snippet(node.lineno, node.col_offset,
-                                       node.end_lineno, node.end_col_offset)
+    """
+    Returns the source code of the given node. The result is memoized per
+    node, as it is requested multiple times for most nodes.
+    """
+    key = id(node)
+    code = self._src_cache.get(key)
+    if code is None:
+        code = self.sourcecode.get_snippet(node.lineno, node.col_offset,
+                                           node.end_lineno,
+                                           node.end_col_offset)
+        self._src_cache[key] = code
+    return code
+
+
+def parse_type(self, name):
+    """
+    Parses the given type name. The result is cached per name, since the same
+    types (e.g. "str", "int" or common base classes) are requested over and
+    over again. Sharing the instance is safe, as setType duplicates the type
+    before modifying it (e.g. its origin).
+    """
+    tpe = self._type_cache.get(name)
+    if tpe is None:
+        tpe = NodeBuilderKt.parseType(self.frontend, name)
+        self._type_cache[name] = tpe
+    return tpe
 
 
 def log_with_loc(self, string, level=1, loglevel="DEBUG"):
+    if loglevel == "DEBUG" and not self._log_debug_enabled:
+        # skip the (expensive) stack inspection below
+        return
+
     callerframerecord = inspect.stack()[level]
     frame = callerframerecord[0]
     info = inspect.getframeinfo(frame)
@@ -58,6 +90,25 @@ def log_with_loc(self, string, level=1, loglevel="DEBUG"):
         self.logger.error(msg)
 
 
+def log_with_loc_lazy(self, msg_factory, level=1, loglevel="DEBUG"):
+    """
+    Same as log_with_loc, but the message is only built (by calling
+    msg_factory) if the given log level is enabled. Use this for messages
+    that are expensive to format, e.g. ones containing an ast.dump().
+    """
+    if loglevel == "DEBUG":
+        enabled = self._log_debug_enabled
+    elif loglevel == "INFO":
+        enabled = self.logger.isInfoEnabled()
+    elif loglevel == "WARN":
+        enabled = self.logger.isWarnEnabled()
+    else:
+        enabled = self.logger.isErrorEnabled()
+
+    if enabled:
+        self.log_with_loc(msg_factory(), level=level + 1, loglevel=loglevel)
+
+
 def add_loc_info(self, node, obj):
     """
     Add file location meta information to CPG objects.
@@ -92,11 +143,14 @@ def add_mul_loc_infos(self, start_node, end_node, obj):
                                             end_node.end_col_offset + 1)
                                      )
                     )
-    obj.setCode(self.sourcecode.get_snippet(start_node.lineno,
-                                            start_node.col_offset,
-                                            end_node.end_lineno,
-                                            end_node.end_col_offset)
-                )
+    if start_node is end_node:
+        obj.setCode(self.get_src_code(start_node))
+    else:
+        obj.setCode(self.sourcecode.get_snippet(start_node.lineno,
+                                                start_node.col_offset,
+                                                end_node.end_lineno,
+                                                end_node.end_col_offset)
+                    )
     # obj.setCode(ast.unparse(node)) # alternative to CodeExtractor class
 
 
@@ -186,7 +240,7 @@ def handle_operator_code(self, opcode):
     elif isinstance(opcode, ast.Mod):
         op = "%"
     elif isinstance(opcode, ast.Pow):
-        op = "^"
+        op = "**"
     elif isinstance(opcode, ast.LShift):
         op = "<<"
     elif isinstance(opcode, ast.RShift):
@@ -23,248 +23,230 @@
 #                    \______/ \__|       \______/
 #
 from ._misc import NOT_IMPLEMENTED_MSG
+from ._misc import UNKNOWN_TYPE
 from ._spotless_dummy import *
 from de.fraunhofer.aisec.cpg.graph import DeclarationBuilderKt
 from de.fraunhofer.aisec.cpg.graph import NodeBuilderKt
 from de.fraunhofer.aisec.cpg.graph import StatementBuilderKt
 from de.fraunhofer.aisec.cpg.graph import ExpressionBuilderKt
 from de.fraunhofer.aisec.cpg.graph.statements import CompoundStatement
-from de.fraunhofer.aisec.cpg.graph.types import UnknownType
+from itertools import islice
 import ast
 
+# Frequently used builder functions, bound once on import. This saves the
+# attribute lookups on the Java classes for every AST node.
+_new_statement = StatementBuilderKt.newStatement
+_new_compound_statement = StatementBuilderKt.newCompoundStatement
+_new_declaration_statement = StatementBuilderKt.newDeclarationStatement
+_new_for_each_statement = StatementBuilderKt.newForEachStatement
+_new_if_statement = StatementBuilderKt.newIfStatement
+_new_return_statement = StatementBuilderKt.newReturnStatement
+_new_while_statement = StatementBuilderKt.newWhileStatement
+_new_field_declaration = DeclarationBuilderKt.newFieldDeclaration
+_new_variable_declaration = DeclarationBuilderKt.newVariableDeclaration
+_new_binary_operator = ExpressionBuilderKt.newBinaryOperator
+
 
 def handle_statement(self, stmt):
-    self.log_with_loc("Start \"handle_statement\" for:\n%s\n" %
-                      (self.get_src_code(stmt)))
+    if self._log_debug_enabled:
+        self.log_with_loc("Start \"handle_statement\" for:\n%s\n" %
+                          (self.get_src_code(stmt)))
     r = self.handle_statement_impl(stmt)
     self.add_loc_info(stmt, r)
-    self.log_with_loc("End \"handle_statement\" for:\n%s\nResult is: %s" %
-                      (self.get_src_code(stmt),
-                       r))
+    if self._log_debug_enabled:
+        self.log_with_loc(
+            "End \"handle_statement\" for:\n%s\nResult is: %s" %
+            (self.get_src_code(stmt), r))
     return r
 
 
 def handle_statement_impl(self, stmt):
-    if isinstance(stmt, ast.FunctionDef):
-        return self.handle_function_or_method(stmt)
-    elif isinstance(stmt, ast.AsyncFunctionDef):
-        return self.handle_function_or_method(stmt)
-    elif isinstance(stmt, ast.ClassDef):
-        cls = DeclarationBuilderKt.newRecordDeclaration(
-            self.frontend, stmt.name, "class", self.get_src_code(stmt))
-        bases = []
-        for base in stmt.bases:
-            if not isinstance(base, ast.Name):
-                self.log_with_loc(
-                    "Expected a name, but got: %s" %
-                    (type(base)), loglevel="ERROR")
-            else:
-                namespace = self.scopemanager.getCurrentNamespace()
-                tname = "%s.%s" % (namespace.toString(), base.id)
-                self.log_with_loc("Building super type using current "
-                                  "namespace: %s" % tname)
-                t = NodeBuilderKt.parseType(self.frontend, tname)
-                bases.append(t)
-        cls.setSuperClasses(bases)
-
-        self.scopemanager.enterScope(cls)
-        for keyword in stmt.keywords:
-            self.log_with_loc(NOT_IMPLEMENTED_MSG, loglevel="ERROR")
-        for s in stmt.body:
-            if isinstance(s, ast.FunctionDef):
-                cls.addMethod(self.handle_function_or_method(s, cls))
-            elif isinstance(s, ast.stmt):
-                handled_stmt = self.handle_statement(s)
-                if self.is_declaration(handled_stmt):
-                    handled_stmt = self.wrap_declaration_to_stmt(handled_stmt)
-                cls.addStatement(handled_stmt)
-        for decorator in stmt.decorator_list:
-            self.log_with_loc(NOT_IMPLEMENTED_MSG, loglevel="ERROR")
-        self.scopemanager.leaveScope(cls)
-        self.scopemanager.addDeclaration(cls)
-        return cls
-    elif isinstance(stmt, ast.Return):
-        r = StatementBuilderKt.newReturnStatement(self.frontend,
-                                                  self.get_src_code(stmt))
-        if stmt.value is not None:
-            r.setReturnValue(self.handle_expression(stmt.value)
-                             )
-        return r
-    elif isinstance(stmt, ast.Delete):
-        self.log_with_loc(NOT_IMPLEMENTED_MSG, loglevel="ERROR")
-        r = StatementBuilderKt.newStatement(self.frontend,
-                                            "")
-        return r
-    elif isinstance(stmt, ast.Assign):
-        return self.handle_assign(stmt)
-    elif isinstance(stmt, ast.AugAssign):
-        return self.handle_assign(stmt)
-    elif isinstance(stmt, ast.AnnAssign):
-        return self.handle_assign(stmt)
-    elif isinstance(stmt, ast.For):
-        return self.handle_for(stmt)
-    elif isinstance(stmt, ast.AsyncFor):
-        return self.handle_for(stmt)
-    elif isinstance(stmt, ast.While):
-        # While(expr test, stmt* body, stmt* orelse)
-        whl_stmt = StatementBuilderKt.newWhileStatement(self.frontend,
-                                                        self.get_src_code(stmt)
-                                                        )
-        expr = self.handle_expression(stmt.test)
-        if self.is_declaration(expr):
-            whl_stmt.setConditionDeclaration(expr)
-        else:
-            whl_stmt.setCondition(expr)
-        body = self.make_compound_statement(stmt.body)
-        whl_stmt.setStatement(body)
-        if stmt.orelse is not None and len(stmt.orelse) != 0:
+    handler = _STMT_HANDLERS.get(type(stmt),
+                                 handle_not_implemented_statement)
+    return handler(self, stmt)
+
+
+def handle_class_def(self, stmt):
+    cls = DeclarationBuilderKt.newRecordDeclaration(
+        self.frontend, stmt.name, "class", self.get_src_code(stmt))
+    bases = []
+    for base in stmt.bases:
+        if not isinstance(base, ast.Name):
             self.log_with_loc(
-                "\"orelse\" is currently not supported for "
-                "\"while\" statements -> skipping",
-                loglevel="ERROR")
-        return whl_stmt
-    elif isinstance(stmt, ast.If):
-        if_stmt = StatementBuilderKt.newIfStatement(self.frontend,
-                                                    self.get_src_code(stmt))
-        # Condition
-        if_stmt.setCondition(self.handle_expression(stmt.test))
-        # Then
-        body = self.make_compound_statement(stmt.body)
-        if_stmt.setThenStatement(body)
-        # Else
-        if stmt.orelse is not None and len(stmt.orelse) != 0:
-            orelse = self.make_compound_statement(stmt.orelse)
-            if_stmt.setElseStatement(orelse)
-        return if_stmt
-
-    elif isinstance(stmt, ast.With):
-        self.log_with_loc(NOT_IMPLEMENTED_MSG, loglevel="ERROR")
-        r = StatementBuilderKt.newStatement(self.frontend, "")
-        return r
-    elif isinstance(stmt, ast.AsyncWith):
-        self.log_with_loc(NOT_IMPLEMENTED_MSG, loglevel="ERROR")
-        r = StatementBuilderKt.newStatement(self.frontend, "")
-        return r
-    elif isinstance(stmt, ast.Raise):
+                "Expected a name, but got: %s" %
+                (type(base)), loglevel="ERROR")
+        else:
+            namespace = self.scopemanager.getCurrentNamespace()
+            tname = "%s.%s" % (namespace.toString(), base.id)
+            self.log_with_loc("Building super type using current "
+                              "namespace: %s" % tname)
+            t = self.parse_type(tname)
+            bases.append(t)
+    cls.setSuperClasses(bases)
+
+    self.scopemanager.enterScope(cls)
+    if stmt.keywords:
         self.log_with_loc(NOT_IMPLEMENTED_MSG, loglevel="ERROR")
-        r = StatementBuilderKt.newStatement(self.frontend, "")
-        return r
-    elif isinstance(stmt, ast.Assert):
+    for s in stmt.body:
+        if isinstance(s, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            cls.addMethod(self.handle_function_or_method(s, cls))
+        elif isinstance(s, ast.stmt):
+            handled_stmt = self.handle_statement(s)
+            if self.is_declaration(handled_stmt):
+                handled_stmt = self.wrap_declaration_to_stmt(handled_stmt)
+            cls.addStatement(handled_stmt)
+    if stmt.decorator_list:
         self.log_with_loc(NOT_IMPLEMENTED_MSG, loglevel="ERROR")
-        r = StatementBuilderKt.newStatement(self.frontend, "")
-        return r
-    elif isinstance(stmt, ast.Import):
-        """
-        ast.Import = class Import(stmt)
-         |  Import(alias* names)
-
-         Example: import Foo, Bar as Baz, Blub
-        """
-
-        decl_stmt = StatementBuilderKt.newDeclarationStatement(
-            self.frontend, self.get_src_code(stmt))
-        for s in stmt.names:
-            if s.asname is not None:
-                name = s.asname
-                src = name + " as " + s.asname
-            else:
-                name = s.name
-                src = name
-            tpe = UnknownType.getUnknownType()
-            v = DeclarationBuilderKt.newVariableDeclaration(self.frontend,
-                                                            name, tpe, src,
-                                                            False)
-            # inaccurate but ast.alias does not hold location information
-            self.scopemanager.addDeclaration(v)
-            decl_stmt.addDeclaration(v)
-        return decl_stmt
-    elif isinstance(stmt, ast.ImportFrom):
-        """
-        ast.ImportFrom = class ImportFrom(stmt)
-         |  ImportFrom(identifier? module, alias* names, int? level)
+    self.scopemanager.leaveScope(cls)
+    self.scopemanager.addDeclaration(cls)
+    return cls
+
+
+def handle_return(self, stmt):
+    r = _new_return_statement(self.frontend, self.get_src_code(stmt))
+    if stmt.value is not None:
+        r.setReturnValue(self.handle_expression(stmt.value)
+                         )
+    return r
 
-         Example: from foo import bar, baz as blub
-        """
 
-        # general warning
+def handle_while(self, stmt):
+    # While(expr test, stmt* body, stmt* orelse)
+    whl_stmt = _new_while_statement(self.frontend, self.get_src_code(stmt))
+    expr = self.handle_expression(stmt.test)
+    if self.is_declaration(expr):
+        whl_stmt.setConditionDeclaration(expr)
+    else:
+        whl_stmt.setCondition(expr)
+    body = self.make_compound_statement(stmt.body)
+    whl_stmt.setStatement(body)
+    if stmt.orelse:
         self.log_with_loc(
-            "Cannot correctly handle \"import from\". Using an approximation.",
+            "\"orelse\" is currently not supported for "
+            "\"while\" statements -> skipping",
             loglevel="ERROR")
+    return whl_stmt
 
-        decl_stmt = StatementBuilderKt.newDeclarationStatement(
-            self.frontend, self.get_src_code(stmt))
-        for s in stmt.names:
-            if s.asname is not None:
-                name = s.asname
-                src = name + " as " + s.asname
-            else:
-                name = s.name
-                src = name
-            tpe = UnknownType.getUnknownType()
-            v = DeclarationBuilderKt.newVariableDeclaration(
-                self.frontend, name, tpe, src, False)
-            # inaccurate but ast.alias does not hold location information
-            self.scopemanager.addDeclaration(v)
-            decl_stmt.addDeclaration(v)
-        return decl_stmt
-    elif isinstance(stmt, ast.Global):
-        self.log_with_loc(NOT_IMPLEMENTED_MSG, loglevel="ERROR")
-        r = StatementBuilderKt.newStatement(self.frontend, "")
-        return r
-    elif isinstance(stmt, ast.Nonlocal):
-        self.log_with_loc(NOT_IMPLEMENTED_MSG, loglevel="ERROR")
-        r = StatementBuilderKt.newStatement(self.frontend, "")
-        return r
-    elif isinstance(stmt, ast.Expr):
-        return self.handle_expression(stmt.value)
-    elif isinstance(stmt, ast.Pass):
-        p = StatementBuilderKt.newEmptyStatement(self.frontend, "pass")
-        return p
-    elif isinstance(stmt, ast.Break):
-        brk = StatementBuilderKt.newBreakStatement(self.frontend,
-                                                   self.get_src_code(stmt))
-        return brk
-    elif isinstance(stmt, ast.Continue):
-        self.log_with_loc(NOT_IMPLEMENTED_MSG, loglevel="ERROR")
-        r = StatementBuilderKt.newStatement(self.frontend, "")
-        return r
-    elif isinstance(stmt, ast.Try):
-        s = StatementBuilderKt.newTryStatement(self.frontend,
+
+def handle_if(self, stmt):
+    if_stmt = _new_if_statement(self.frontend, self.get_src_code(stmt))
+    # Condition
+    if_stmt.setCondition(self.handle_expression(stmt.test))
+    # Then
+    body = self.make_compound_statement(stmt.body)
+    if_stmt.setThenStatement(body)
+    # Else
+    if stmt.orelse:
+        orelse = self.make_compound_statement(stmt.orelse)
+        if_stmt.setElseStatement(orelse)
+    return if_stmt
+
+
+def handle_import(self, stmt):
+    """
+    ast.Import = class Import(stmt)
+     |  Import(alias* names)
+
+     Example: import Foo, Bar as Baz, Blub
+    """
+
+    decl_stmt = _new_declaration_statement(
+        self.frontend, self.get_src_code(stmt))
+    decls = []
+    for s in stmt.names:
+        name, src = _alias_name_and_src(s)
+        # inaccurate but ast.alias does not hold location information
+        v = _new_variable_declaration(self.frontend, name, UNKNOWN_TYPE, src,
+                                      False)
+        decls.append(v)
+    # add all declarations at once to save calls into the JVM
+    self.scopemanager.addDeclarations(decls)
+    decl_stmt.setLocals(decls)
+    return decl_stmt
+
+
+def handle_import_from(self, stmt):
+    """
+    ast.ImportFrom = class ImportFrom(stmt)
+     |  ImportFrom(identifier? module, alias* names, int? level)
+
+     Example: from foo import bar, baz as blub
+    """
+
+    # general warning
+    self.log_with_loc(
+        "Cannot correctly handle \"import from\". Using an approximation.",
+        loglevel="ERROR")
+
+    decl_stmt = _new_declaration_statement(
+        self.frontend, self.get_src_code(stmt))
+    decls = []
+    for s in stmt.names:
+        name, src = _alias_name_and_src(s)
+        # inaccurate but ast.alias does not hold location information
+        v = _new_variable_declaration(self.frontend, name, UNKNOWN_TYPE, src,
+                                      False)
+        decls.append(v)
+    # add all declarations at once to save calls into the JVM
+    self.scopemanager.addDeclarations(decls)
+    decl_stmt.setLocals(decls)
+    return decl_stmt
+
+
+def _alias_name_and_src(alias):
+    """
+    Returns the name an ast.alias is bound to and its source code, e.g.
+    ("baz", "bar as baz") for "import bar as baz".
+    """
+    if alias.asname:
+        return alias.asname, alias.name + " as " + alias.asname
+    return alias.name, alias.name
+
+
+def handle_expr(self, stmt):
+    return self.handle_expression(stmt.value)
+
+
+def handle_pass(self, stmt):
+    p = StatementBuilderKt.newEmptyStatement(self.frontend, "pass")
+    return p
+
+
+def handle_break(self, stmt):
+    brk = StatementBuilderKt.newBreakStatement(self.frontend,
                                                self.get_src_code(stmt))
-        try_block = self.make_compound_statement(stmt.body)
-        finally_block = self.make_compound_statement(stmt.finalbody)
-        if stmt.orelse is not None and len(stmt.orelse) != 0:
-            self.log_with_loc(NOT_IMPLEMENTED_MSG, loglevel="ERROR")
-        if len(stmt.handlers) != 0:
-            self.log_with_loc(
-                "Try handlers. " +
-                NOT_IMPLEMENTED_MSG,
-                loglevel="ERROR")
-        s.setTryBlock(try_block)
-        s.setFinallyBlock(finally_block)
-        return s
-    else:
-        self.log_with_loc(NOT_IMPLEMENTED_MSG, loglevel="ERROR")
-        self.log_with_loc(
-            "Received unexpected stmt: %s with type %s" %
-            (stmt, type(stmt)))
-        r = StatementBuilderKt.newStatement(self.frontend, "")
-        return r
+    return brk
 
 
-def handle_function_or_method(self, node, record=None):
-    if not isinstance(
-            node,
-            ast.FunctionDef) and not isinstance(
-            node,
-            ast.AsyncFunctionDef):
+def handle_try(self, stmt):
+    s = StatementBuilderKt.newTryStatement(self.frontend,
+                                           self.get_src_code(stmt))
+    try_block = self.make_compound_statement(stmt.body)
+    finally_block = self.make_compound_statement(stmt.finalbody)
+    if stmt.orelse:
+        self.log_with_loc(NOT_IMPLEMENTED_MSG, loglevel="ERROR")
+    if stmt.handlers:
         self.log_with_loc(
-            "Expected either ast.FunctionDef or ast.AsyncFunctionDef",
+            "Try handlers. " +
+            NOT_IMPLEMENTED_MSG,
             loglevel="ERROR")
-        r = DeclarationBuilderKt.newFunctionDeclaration(self.frontend,
-                                                        "DUMMY", "DUMMY")
-        return r
+    s.setTryBlock(try_block)
+    s.setFinallyBlock(finally_block)
+    return s
+
+
+def handle_not_implemented_statement(self, stmt):
+    self.log_with_loc(NOT_IMPLEMENTED_MSG, loglevel="ERROR")
+    self.log_with_loc_lazy(
+        lambda: "Received unsupported stmt: %s with type %s" %
+        (stmt, type(stmt)))
+    r = _new_statement(self.frontend, "")
+    return r
+
 
+def handle_function_or_method(self, node, record=None):
+    # node is either an ast.FunctionDef or an ast.AsyncFunctionDef, see
+    # _STMT_HANDLERS and handle_class_def
     if isinstance(node, ast.AsyncFunctionDef):
         self.log_with_loc(
             "\"async\" is currently not supported and the information is lost "
@@ -272,7 +254,8 @@ def handle_function_or_method(self, node, record=None):
 
     # FunctionDef(identifier name, arguments args, stmt* body, expr*
     # decorator_list, expr? returns, string? type_comment)
-    self.log_with_loc("Handling a function/method: %s" % (ast.dump(node)))
+    self.log_with_loc_lazy(
+        lambda: "Handling a function/method: %s" % (ast.dump(node)))
 
     if isinstance(node.name, str):
         name = node.name
@@ -294,16 +277,18 @@ def handle_function_or_method(self, node, record=None):
 
     self.scopemanager.enterScope(f)
 
-    for arg in node.args.posonlyargs:
+    args = node.args
+    if args.posonlyargs:
         self.log_with_loc(NOT_IMPLEMENTED_MSG, loglevel="ERROR")
 
     # First argument is the receiver in case of a method
+    recv_name = None
     if record is not None:
-        if len(node.args.args) > 0:
-            recv_node = node.args.args[0]
-            tpe = NodeBuilderKt.parseType(self.frontend,
-                                          record.getName())
-            recv = DeclarationBuilderKt.newVariableDeclaration(
+        if args.args:
+            recv_node = args.args[0]
+            recv_name = recv_node.arg
+            tpe = self.parse_type(record.getName())
+            recv = _new_variable_declaration(
                 self.frontend,
                 recv_node.arg, tpe, self.get_src_code(recv_node),
                 False)
@@ -313,27 +298,30 @@ def handle_function_or_method(self, node, record=None):
             self.log_with_loc(
                 "Expected to find the receiver but got nothing...",
                 loglevel="ERROR")
-        for arg in node.args.args[1:]:
+        for arg in islice(args.args, 1, None):
             self.handle_argument(arg)
     else:
-        for arg in node.args.args:
+        for arg in args.args:
             self.handle_argument(arg)
+    # Keep track of the receiver name on the Python side. This saves a few
+    # calls into the JVM when checking for "self.x = ..." in
+    # handle_assign_impl.
+    self._receiver_name_stack.append(recv_name)
 
-    if node.args.vararg is not None:
+    # *args and **kwargs
+    if args.vararg is not None or args.kwarg is not None:
         self.log_with_loc(NOT_IMPLEMENTED_MSG, loglevel="ERROR")
-    for arg in node.args.kwonlyargs:
+    # log once per unsupported kind of argument, not once per argument
+    # (kw_defaults always has the same length as kwonlyargs)
+    if args.kwonlyargs:
         self.log_with_loc(NOT_IMPLEMENTED_MSG, loglevel="ERROR")
-    for arg in node.args.kw_defaults:
-        self.log_with_loc(NOT_IMPLEMENTED_MSG, loglevel="ERROR")
-    if node.args.kwarg is not None:
-        self.log_with_loc(NOT_IMPLEMENTED_MSG, loglevel="ERROR")
-    for arg in node.args.defaults:
+    if args.defaults:
         self.log_with_loc(
             "Default args. " +
             NOT_IMPLEMENTED_MSG,
             loglevel="ERROR")
 
-    if len(node.body) > 0:
+    if node.body:
         f.setBody(self.make_compound_statement(node.body))
 
     annotations = []
@@ -343,6 +331,7 @@ def handle_function_or_method(self, node, record=None):
         # expr = self.visit(decorator)
 
         members = []
+        func_code = self.get_src_code(decorator.func)
 
         if isinstance(decorator.func, ast.Attribute):
             # unfortunately, FQN'ing does not work here correctly because at
@@ -352,27 +341,24 @@ def handle_function_or_method(self, node, record=None):
             # a type listener in the Annotation to correctly resolve the base
             ref = self.handle_expression(decorator.func)
             annotation = NodeBuilderKt.newAnnotation(
-                self.frontend, ref.getCode(),
-                self.get_src_code(decorator.func))
+                self.frontend, ref.getCode(), func_code)
 
             # add the base as a receiver annotation
             member = NodeBuilderKt.newAnnotationMember(
-                self.frontend, "receiver", ref.getBase(),
-                self.get_src_code(decorator.func))
+                self.frontend, "receiver", ref.getBase(), func_code)
 
             members.append(member)
         elif isinstance(decorator.func, ast.Name):
             ref = self.handle_expression(decorator.func)
             annotation = NodeBuilderKt.newAnnotation(
-                self.frontend, ref.getName(),
-                self.get_src_code(decorator.func))
+                self.frontend, ref.getName(), func_code)
 
         else:
             self.log_with_loc(NOT_IMPLEMENTED_MSG, loglevel="ERROR")
             # TODO empty annotation
 
         # add first arg as value
-        if len(decorator.args) > 0:
+        if decorator.args:
             arg0 = decorator.args[0]
             value = self.handle_expression(arg0)
 
@@ -389,6 +375,7 @@ def handle_function_or_method(self, node, record=None):
 
             members.append(member)
 
+        # all members are set with a single call
         annotation.setMembers(members)
         annotations.append(annotation)
 
@@ -397,6 +384,7 @@ def handle_function_or_method(self, node, record=None):
     if node.returns is not None:
         self.log_with_loc(NOT_IMPLEMENTED_MSG, loglevel="ERROR")
 
+    self._receiver_name_stack.pop()
     self.scopemanager.leaveScope(f)
     self.scopemanager.addDeclaration(f)
 
@@ -404,11 +392,12 @@ def handle_function_or_method(self, node, record=None):
 
 
 def handle_argument(self, arg: ast.arg):
-    self.log_with_loc("Handling an argument: %s" % (ast.dump(arg)))
+    self.log_with_loc_lazy(
+        lambda: "Handling an argument: %s" % (ast.dump(arg)))
     if arg.annotation is not None:
-        tpe = NodeBuilderKt.parseType(self.frontend, arg.annotation.id)
+        tpe = self.parse_type(arg.annotation.id)
     else:
-        tpe = UnknownType.getUnknownType()
+        tpe = UNKNOWN_TYPE
     # TODO variadic
     pvd = DeclarationBuilderKt.newParamVariableDeclaration(
         self.frontend, arg.arg, tpe, False, self.get_src_code(arg))
@@ -418,11 +407,7 @@ def handle_argument(self, arg: ast.arg):
 
 
 def handle_for(self, stmt):
-    if not isinstance(stmt, ast.AsyncFor) and not isinstance(stmt, ast.For):
-        self.log_with_loc(("Expected ast.AsyncFor or ast.For. Skipping"
-                          " evaluation."), loglevel="ERROR")
-        r = StatementBuilderKt.newStatement(self.frontend, "")
-        return r
+    # stmt is either an ast.For or an ast.AsyncFor, see _STMT_HANDLERS
     if isinstance(stmt, ast.AsyncFor):
         self.log_with_loc((
             "\"async\" is currently not supported. The statement"
@@ -430,8 +415,8 @@ def handle_for(self, stmt):
             " graph."), loglevel="ERROR")
 
     # We can handle the AsyncFor / For statement now:
-    for_stmt = StatementBuilderKt.newForEachStatement(self.frontend,
-                                                      self.get_src_code(stmt))
+    for_stmt = _new_for_each_statement(self.frontend,
+                                       self.get_src_code(stmt))
 
     # We handle the iterable before the target so that the type can be set
     # correctly
@@ -441,7 +426,7 @@ def handle_for(self, stmt):
     target = self.handle_expression(stmt.target)
     resolved_target = self.scopemanager.resolveReference(target)
     if resolved_target is None:
-        target = DeclarationBuilderKt.newVariableDeclaration(
+        target = _new_variable_declaration(
             self.frontend, target.getName(),
             it.getType(),
             self.get_src_code(stmt.target),
@@ -454,47 +439,46 @@ def handle_for(self, stmt):
     body = self.make_compound_statement(stmt.body)
     for_stmt.setStatement(body)
 
-    if stmt.orelse is not None and len(stmt.orelse) != 0:
+    if stmt.orelse:
         self.log_with_loc(NOT_IMPLEMENTED_MSG, loglevel="ERROR")
 
     return for_stmt
 
 
 def make_compound_statement(self, stmts) -> CompoundStatement:
-    if stmts is None or len(stmts) == 0:
+    if not stmts:
         self.log_with_loc(
             "Expected at least one statement. Returning a dummy.",
             loglevel="WARN")
-        return StatementBuilderKt.newCompoundStatement(self.frontend, "")
-
-    if False and len(stmts) == 1:
-        """ TODO decide how to handle this... """
-        s = self.handle_statement(stmts[0])
-        if self.is_declaration(s):
+        return _new_compound_statement(self.frontend, "")
+
+    compound_statement = _new_compound_statement(self.frontend, "")
+    handled_stmts = []
+    # look up the bound methods only once for all statements
+    handle_statement = self.handle_statement
+    is_declaration = self.is_declaration
+    for s in stmts:
+        s = handle_statement(s)
+        if is_declaration(s):
             s = self.wrap_declaration_to_stmt(s)
-        return s
-    else:
-        compound_statement = StatementBuilderKt.newCompoundStatement(
-            self.frontend, "")
-        for s in stmts:
-            s = self.handle_statement(s)
-            if self.is_declaration(s):
-                s = self.wrap_declaration_to_stmt(s)
-            compound_statement.addStatement(s)
-        if len(stmts) > 0:
-            self.add_mul_loc_infos(stmts[0], stmts[-1], compound_statement)
+        handled_stmts.append(s)
+    # a single call to the JVM instead of one addStatement per statement
+    compound_statement.setStatements(handled_stmts)
+    self.add_mul_loc_infos(stmts[0], stmts[-1], compound_statement)
 
-        return compound_statement
+    return compound_statement
 
 
 def handle_assign(self, stmt):
-    self.log_with_loc("Start \"handle_assign\" for:\n%s\n" %
-                      (self.get_src_code(stmt)))
+    if self._log_debug_enabled:
+        self.log_with_loc("Start \"handle_assign\" for:\n%s\n" %
+                          (self.get_src_code(stmt)))
     r = self.handle_assign_impl(stmt)
     self.add_loc_info(stmt, r)
-    self.log_with_loc("End \"handle_assign\" for:\n%s\nResult is: %s" %
-                      (self.get_src_code(stmt),
-                       r))
+    if self._log_debug_enabled:
+        self.log_with_loc(
+            "End \"handle_assign\" for:\n%s\nResult is: %s" %
+            (self.get_src_code(stmt), r))
     return r
 
 
@@ -503,26 +487,27 @@ def handle_assign_impl(self, stmt):
     This function handles assignments (ast.Assign, ast.AnnAssign,
     ast.AugAssign)
     """
-    if stmt is ast.AugAssign:
-        target = self.handle_expression(stmt.target)
-        op = self.handle_operator_code(stmt.op)
-        value = self.handle_expression(stmt.value)
-        r = ExpressionBuilderKt.newBinaryOperator(self.frontend,
-                                                  op, self.get_src_code(stmt))
-        r.setLhs(target)
-        r.setRhs(value)
-        return r
-    if isinstance(stmt, ast.Assign) and len(stmt.targets) != 1:
-        self.log_with_loc(NOT_IMPLEMENTED_MSG, loglevel="ERROR")
-        r = ExpressionBuilderKt.newBinaryOperator(self.frontend,
-                                                  "=", self.get_src_code(stmt)
-                                                  )
-        return r
     if isinstance(stmt, ast.Assign):
+        if len(stmt.targets) != 1:
+            self.log_with_loc(NOT_IMPLEMENTED_MSG, loglevel="ERROR")
+            r = _new_binary_operator(self.frontend, "=",
+                                     self.get_src_code(stmt))
+            return r
         target = stmt.targets[0]
     else:
         target = stmt.target
 
+    if isinstance(stmt, ast.AugAssign):
+        # e.g. "a += 1" -> BinaryOperator "+="
+        lhs = self.handle_expression(target)
+        op = self.handle_operator_code(stmt.op)
+        rhs = self.handle_expression(stmt.value)
+        r = _new_binary_operator(self.frontend, op + "=",
+                                 self.get_src_code(stmt))
+        r.setLhs(lhs)
+        r.setRhs(rhs)
+        return r
+
     # parse LHS and RHS as expressions
     lhs = self.handle_expression(target)
     if stmt.value is not None:
@@ -536,24 +521,24 @@ def handle_assign_impl(self, stmt):
             "Expected a DeclaredReferenceExpression or MemberExpression "
             "but got \"%s\". Skipping." %
             lhs.java_name, loglevel="ERROR")
-        r = ExpressionBuilderKt.newBinaryOperator(self.frontend,
-                                                  "=",
-                                                  self.get_src_code(stmt))
+        r = _new_binary_operator(self.frontend, "=", self.get_src_code(stmt))
         return r
 
     resolved_lhs = self.scopemanager.resolveReference(lhs)
-    in_record = self.scopemanager.isInRecord()
-    in_function = self.scopemanager.isInFunction()
-
     if resolved_lhs is not None:
         # found var => BinaryOperator "="
-        binop = ExpressionBuilderKt.newBinaryOperator(
+        # This is by far the most common case, so do not query the scope
+        # manager for anything else before.
+        binop = _new_binary_operator(
             self.frontend, "=", self.get_src_code(stmt))
         binop.setLhs(lhs)
         if rhs is not None:
             binop.setRhs(rhs)
         return binop
     else:
+        in_record = self.scopemanager.isInRecord()
+        in_function = self.scopemanager.isInFunction()
+
         if in_record and not in_function:
             """
             class Foo:
@@ -571,16 +556,7 @@ def handle_assign_impl(self, stmt):
             self.log_with_loc(
                 "Could not resolve -> creating a new field for: %s" %
                 (name))
-            if rhs is not None:
-                v = DeclarationBuilderKt.newFieldDeclaration(
-                    self.frontend, name, rhs.getType(),
-                    None, self.get_src_code(stmt),
-                    None, rhs, False)  # TODO None -> add infos
-            else:
-                v = DeclarationBuilderKt.newFieldDeclaration(
-                    self.frontend, name, UnknownType.getUnknownType(),
-                    None, self.get_src_code(stmt),
-                    None, None, False)  # TODO None -> add infos
+            v = self.make_assign_declaration(stmt, name, rhs, field=True)
             self.scopemanager.addDeclaration(v)
             return v
         elif in_record and in_function:
@@ -594,56 +570,31 @@ def handle_assign_impl(self, stmt):
                 self.log_with_loc(
                     "Could not resolve -> creating a new variable for: %s"
                     % (lhs.getName()))
-                if rhs is not None:
-                    v = DeclarationBuilderKt.newVariableDeclaration(
-                        self.frontend, lhs.getName(),
-                        rhs.getType(),
-                        self.get_src_code(stmt),
-                        False)
-                else:
-                    v = DeclarationBuilderKt.newVariableDeclaration(
-                        self.frontend, lhs.getName(),
-                        UnknownType.getUnknownType(),
-                        self.get_src_code(stmt),
-                        False)
-                if rhs is not None:
-                    v.setInitializer(rhs)
+                v = self.make_assign_declaration(stmt, lhs.getName(), rhs)
                 self.scopemanager.addDeclaration(v)
                 return v
             else:  # MemberExpression
                 self.log_with_loc(
                     "Probably a new field for: %s" %
                     (lhs.getName()))
-                current_function = self.scopemanager.getCurrentFunction()
                 recv_name = None
+                if self._receiver_name_stack:
+                    recv_name = self._receiver_name_stack[-1]
                 mem_base_is_receiver = False
-                if current_function is not None:
-                    recv = current_function.getReceiver()
-                    if recv is not None:
-                        recv_name = recv.getName()
                 base = lhs.getBase()
-                if self.is_declared_reference(base):
-                    mem_base_is_receiver = base.getName() == recv_name
+                if recv_name is not None and self.is_declared_reference(base):
+                    mem_base_is_receiver = (
+                        base.getName().getLocalName() == recv_name)
                 if not mem_base_is_receiver:
                     self.log_with_loc("I'm confused.", loglevel="ERROR")
-                    return StatementBuilderKt.newStatement(
+                    return _new_statement(
                         self.frontend, "DUMMY")
                 if rhs is not None and self.is_declared_reference(rhs):
                     # TODO figure out why the cpg pass fails to do this...
                     rhs.setRefersTo(
                         self.scopemanager.resolveReference(rhs))
-                if rhs is not None:
-                    v = DeclarationBuilderKt.newFieldDeclaration(
-                        self.frontend, lhs.getName(),
-                        rhs.getType(),
-                        None, self.get_src_code(stmt),
-                        None, rhs, False)
-                else:
-                    v = DeclarationBuilderKt.newFieldDeclaration(
-                        self.frontend, lhs.getName(),
-                        UnknownType.getUnknownType(),
-                        None, self.get_src_code(stmt),
-                        None, None, False)
+                v = self.make_assign_declaration(stmt, lhs.getName(), rhs,
+                                                 field=True)
                 self.scopemanager.addDeclaration(v)
                 self.scopemanager.getCurrentRecord().addField(v)
                 return v
@@ -654,19 +605,55 @@ def handle_assign_impl(self, stmt):
             self.log_with_loc(
                 "Could not resolve -> creating a new variable for: %s" %
                 (lhs.getName()))
-            if rhs is not None:
-                v = DeclarationBuilderKt.newVariableDeclaration(
-                    self.frontend, lhs.getName(),
-                    rhs.getType(),
-                    self.get_src_code(stmt),
-                    False)
-            else:
-                v = DeclarationBuilderKt.newVariableDeclaration(
-                    self.frontend, lhs.getName(),
-                    UnknownType.getUnknownType(),
-                    self.get_src_code(stmt),
-                    False)
-            if rhs is not None:
-                v.setInitializer(rhs)
+            v = self.make_assign_declaration(stmt, lhs.getName(), rhs)
             self.scopemanager.addDeclaration(v)
             return v
+
+
+def make_assign_declaration(self, stmt, name, rhs, field=False):
+    """
+    Creates the field or variable declaration introduced by the assignment
+    stmt. The type (and initializer) is taken from rhs, if available.
+    """
+    if rhs is not None:
+        tpe = rhs.getType()
+    else:
+        tpe = UNKNOWN_TYPE
+
+    if field:
+        # TODO None -> add infos
+        return _new_field_declaration(
+            self.frontend, name, tpe, None, self.get_src_code(stmt),
+            None, rhs, False)
+
+    v = _new_variable_declaration(
+        self.frontend, name, tpe, self.get_src_code(stmt), False)
+    if rhs is not None:
+        v.setInitializer(rhs)
+    return v
+
+
+# Maps each supported ast.stmt class to the function handling it. The
+# functions are called directly (with self) to avoid looking them up on the
+# class for every statement. All other statement types (e.g. ast.With or
+# ast.Raise) are not implemented yet and end up in
+# handle_not_implemented_statement.
+_STMT_HANDLERS = {
+    ast.FunctionDef: handle_function_or_method,
+    ast.AsyncFunctionDef: handle_function_or_method,
+    ast.ClassDef: handle_class_def,
+    ast.Return: handle_return,
+    ast.Assign: handle_assign,
+    ast.AugAssign: handle_assign,
+    ast.AnnAssign: handle_assign,
+    ast.For: handle_for,
+    ast.AsyncFor: handle_for,
+    ast.While: handle_while,
+    ast.If: handle_if,
+    ast.Import: handle_import,
+    ast.ImportFrom: handle_import_from,
+    ast.Expr: handle_expr,
+    ast.Pass: handle_pass,
+    ast.Break: handle_break,
+    ast.Try: handle_try,
+}
@@ -231,6 +231,90 @@ class PythonFrontendTest : BaseTest() {
         assertNotNull(`if`)
     }
 
+    @Test
+    fun testAugAssign() {
+        val topLevel = Path.of("src", "test", "resources", "python")
+        val tu =
+            TestUtils.analyzeAndGetFirstTU(
+                listOf(topLevel.resolve("aug_assign.py").toFile()),
+                topLevel,
+                true
+            ) {
+                it.registerLanguage<PythonLanguage>()
+            }
+        assertNotNull(tu)
+
+        val p = tu.namespaces["aug_assign"]
+        val foo = p.functions["foo"]
+        assertNotNull(foo)
+
+        val body = foo.body as? CompoundStatement
+        assertNotNull(body)
+
+        val a = body.variables["a"]
+        assertNotNull(a)
+
+        for ((i, op) in listOf("+=", "//=", "**=").withIndex()) {
+            val augAssign = body.statements[i + 1] as? BinaryOperator
+            assertNotNull(augAssign)
+            assertEquals(op, augAssign.operatorCode)
+            assertTrue(augAssign.operatorCode in BinaryOperator.compoundOperators)
+
+            val lhs = augAssign.lhs as? DeclaredReferenceExpression
+            assertNotNull(lhs)
+            assertEquals(a, lhs.refersTo)
+
+            val rhs = augAssign.rhs as? Literal<*>
+            assertNotNull(rhs)
+            assertEquals(i + 2L, rhs.value)
+
+            // compound assignments read and write the target
+            assertContains(augAssign.prevDFG, lhs)
+            assertContains(augAssign.nextDFG, lhs)
+            assertContains(augAssign.prevDFG, rhs)
+        }
+    }
+
+    @Test
+    fun testImports() {
+        val topLevel = Path.of("src", "test", "resources", "python")
+        val tu =
+            TestUtils.analyzeAndGetFirstTU(
+                listOf(topLevel.resolve("imports.py").toFile()),
+                topLevel,
+                true
+            ) {
+                it.registerLanguage<PythonLanguage>()
+            }
+        assertNotNull(tu)
+
+        val p = tu.namespaces["imports"]
+        assertNotNull(p)
+
+        val os = p.variables["os"]
+        assertNotNull(os)
+        assertEquals("os", os.code)
+
+        val osp = p.variables["osp"]
+        assertNotNull(osp)
+        assertEquals("os.path as osp", osp.code)
+
+        val bar = p.variables["bar"]
+        assertNotNull(bar)
+        assertEquals("bar", bar.code)
+
+        val blub = p.variables["blub"]
+        assertNotNull(blub)
+        assertEquals("baz as blub", blub.code)
+
+        // the import statements keep their variables as locals
+        val imports = p.statements.filterIsInstance<DeclarationStatement>()
+        assertEquals(3, imports.size)
+        assertEquals(listOf(os), imports[0].locals)
+        assertEquals(listOf(osp), imports[1].locals)
+        assertEquals(listOf(bar, blub), imports[2].locals)
+    }
+
     @Test
     fun testSimpleClass() {
         val topLevel = Path.of("src", "test", "resources", "python")
@@ -254,13 +338,19 @@ class PythonFrontendTest : BaseTest() {
         assertNotNull(foo)
 
         assertLocalName("SomeClass", cls)
-        assertEquals(1, cls.methods.size)
+        assertEquals(2, cls.methods.size)
         assertEquals(1, cls.constructors.size) // auto generated by cpg
         assertEquals(true, cls.constructors.first().isInferred)
 
         val clsfunc = cls.methods.first()
         assertLocalName("someFunc", clsfunc)
 
+        // async methods are handled like regular methods
+        val asyncFunc = cls.methods["someAsyncFunc"]
+        assertNotNull(asyncFunc)
+        assertLocalName("self", asyncFunc.receiver)
+        assertEquals(0, asyncFunc.parameters.size)
+
         assertLocalName("foo", foo)
         val body = foo.body as? CompoundStatement
         assertNotNull(body)
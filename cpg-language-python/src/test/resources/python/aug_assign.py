@@ -0,0 +1,5 @@
+def foo():
+    a = 1
+    a += 2
+    a //= 3
+    a **= 4
@@ -0,0 +1,3 @@
+import os
+import os.path as osp
+from foo import bar, baz as blub
@@ -2,6 +2,9 @@ class SomeClass:
     def someFunc(self):
         pass
 
+    async def someAsyncFunc(self):
+        pass
+
 
 def foo():
     c1 = SomeClass()